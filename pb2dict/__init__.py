@@ -1,5 +1,7 @@
 import datetime
-from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union
+import keyword
+import math
+from typing import Any, Callable, Dict, Optional, Set, Type, TypeVar, Union
 
 from google.protobuf.descriptor import FieldDescriptor
 from google.protobuf.message import Message
@@ -8,7 +10,23 @@ from google.protobuf.timestamp_pb2 import Timestamp
 __all__ = ["to_dict", "to_message", "fields"]
 
 EXTENSION_CONTAINER = "___X"
-Timestamp_type_name = "Timestamp"
+
+# The well-known Timestamp descriptor is a singleton in the descriptor pool,
+# so an identity check is both cheaper than a name comparison and immune to
+# user-defined messages that happen to be called "Timestamp".
+_TIMESTAMP_DESC = Timestamp.DESCRIPTOR
+
+# Unbound ToDatetime, shared by every Timestamp field: calling it with the
+# timestamp as its argument skips a per-field lambda and its extra frame.
+_TS_DECODE = Timestamp.ToDatetime
+
+# Pre-bound descriptor constants. Looking these up as module globals is one
+# LOAD_GLOBAL instead of LOAD_GLOBAL + LOAD_ATTR per comparison in the hot
+# field loops below.
+_LABEL_REPEATED = FieldDescriptor.LABEL_REPEATED
+_TYPE_MESSAGE = FieldDescriptor.TYPE_MESSAGE
+_TYPE_ENUM = FieldDescriptor.TYPE_ENUM
+_CPPTYPE_MESSAGE = FieldDescriptor.CPPTYPE_MESSAGE
 
 T = TypeVar("T", bound=Message)
 
@@ -55,19 +73,89 @@ DEFAULT_DECODE_MAP: Dict[int, Callable[[Any], Any]] = {
     fields.ENUM: int,
 }
 
+# DEFAULT_DECODE_MAP flattened into a list indexed by the protobuf TYPE_*
+# tag (small consecutive ints), so the default lookup is a C-level array
+# index instead of a hash.
+_DECODER_BY_TYPE = [DEFAULT_DECODE_MAP.get(t) for t in range(max(DEFAULT_DECODE_MAP) + 1)]
+_NUM_TYPES = len(_DECODER_BY_TYPE)
+
+
+# Float types need a sign-aware set check: protobuf tracks -0.0 as set
+# (bitwise non-default) but -0.0 is falsy.
+_FLOAT_TYPES = frozenset({FieldDescriptor.TYPE_DOUBLE, FieldDescriptor.TYPE_FLOAT})
+
+# Default decoders that are identity casts on what protobuf already returns
+# (native int/float/bool/str/bytes). Fields decoded by these skip the
+# per-element call entirely.
+_PASSTHROUGH_DECODERS = frozenset({float, int, bool, str, bytes})
+
+# Cache-miss sentinel; None is a meaningful cached value (passthrough).
+_MISSING = object()
+
+# Memoized _is_map_field answers, keyed by the descriptor itself. The upb
+# runtime hands out weakly-cached descriptor wrappers, so an id() key can be
+# recycled by a different field; holding the descriptor cannot alias.
+_MAP_CACHE: Dict[FieldDescriptor, bool] = {}
+
 
 def _is_map_field(fd: FieldDescriptor) -> bool:
     """
     Checks if a field descriptor corresponds to a map field.
 
     A map field is technically a repeated message where the message has a
-    special 'map_entry' option set to True.
+    special 'map_entry' option set to True. GetOptions() builds an options
+    message, which is too heavy for the per-field hot loops, so the answer
+    is cached per descriptor.
     """
-    return (
-        fd.type == FieldDescriptor.TYPE_MESSAGE
-        and fd.message_type.has_options
-        and fd.message_type.GetOptions().map_entry
-    )
+    cached = _MAP_CACHE.get(fd)
+    if cached is None:
+        cached = _MAP_CACHE[fd] = (
+            fd.type == _TYPE_MESSAGE and fd.message_type.has_options and fd.message_type.GetOptions().map_entry
+        )
+    return cached
+
+
+# Precomputed {number: label} maps, keyed by (enum_type, lowercase); like
+# _MAP_CACHE, id() keys could alias recycled upb descriptor wrappers.
+_ENUM_LABELS: Dict[tuple, Dict[int, str]] = {}
+
+# Precomputed {label: number} maps, keyed by enum_type (see _ENUM_LABELS).
+_ENUM_BY_NAME: Dict[Any, Dict[str, int]] = {}
+
+
+def _enum_by_name(enum_type: Any) -> Dict[str, int]:
+    """
+    Returns a cached {label: value number} map for an enum type, the
+    reverse of _enum_labels, used when converting dicts back to messages.
+
+    Uppercased labels are merged in (exact names win on collision), so
+    the usual non-canonical-case inputs resolve on the first .get;
+    callers only uppercase and retry for the remaining mixed-case forms.
+    """
+    numbers = _ENUM_BY_NAME.get(enum_type)
+    if numbers is None:
+        numbers = {v.name.upper(): v.number for v in enum_type.values}
+        numbers.update({v.name: v.number for v in enum_type.values})
+        _ENUM_BY_NAME[enum_type] = numbers
+    return numbers
+
+
+def _enum_labels(enum_type: Any, lowercase: bool) -> Dict[int, str]:
+    """
+    Returns a cached {value number: label} map for an enum type, so enum
+    decoding is a plain dict lookup instead of traversing
+    enum_type.values_by_number per value.
+    """
+    key = (enum_type, lowercase)
+    labels = _ENUM_LABELS.get(key)
+    if labels is None:
+        # allow_alias enums map one number to several names; keep the
+        # first-declared one, matching values_by_number.
+        labels = {}
+        for v in enum_type.values:
+            labels.setdefault(v.number, v.name.lower() if lowercase else v.name)
+        _ENUM_LABELS[key] = labels
+    return labels
 
 
 def _decode_call(
@@ -75,41 +163,275 @@ def _decode_call(
     custom_map: Dict[int, Callable[[Any], Any]],
     use_enum_labels: bool,
     lowercase_enum_labels: bool,
+    recurse: Optional[Callable[..., Dict[str, Any]]] = None,
 ) -> Optional[Callable[[Any], Any]]:
     """
     Determines and returns a callable for decoding a single Protobuf field.
 
     1. If the field type is in custom_map, use that.
-    2. If the field is a Timestamp, return a callable to convert it to datetime.
-    3. If the field is a nested sub-message, return a callable that calls to_dict.
-    4. If the field is an enum and use_enum_labels is True, return a callable
+    2. If the field is a message: Timestamp fields convert to datetime,
+       other sub-messages recurse via `recurse` (default _to_dict; the
+       uncached path passes its own entry so one-off custom maps never
+       reach the shared caches).
+    3. If the field is an enum and use_enum_labels is True, return a callable
        that converts int enum values to labels (optionally lowercase).
-    5. Otherwise, fall back to DEFAULT_DECODE_MAP if available.
-    """
-    if fd.type in custom_map:
-        return custom_map[fd.type]
-
-    if fd.message_type and fd.message_type.name == Timestamp_type_name:
-        return lambda ts: ts.ToDatetime()
-
-    if fd.type == FieldDescriptor.TYPE_MESSAGE:
-        # Nested submessage -> call to_dict
-        return lambda m: to_dict(
-            m,
-            custom_map,
-            use_enum_labels=use_enum_labels,
-            include_defaults=False,
-            lowercase_enum_labels=lowercase_enum_labels,
+    4. Otherwise, fall back to the default decoders.
+
+    Dispatch goes by fd.type first, so primitive fields never load the
+    message_type/enum_type descriptor attributes at all.
+
+    Returns None when no decoding is needed: protobuf already hands back
+    native int/float/bool/str/bytes objects, so the default casts for
+    scalar fields are redundant work. Callers treat None as "store the
+    raw value" (or list()/dict() the container for repeated/map fields).
+    """
+    fd_type = fd.type
+    decode_fn = custom_map.get(fd_type)
+    if decode_fn is not None:
+        return decode_fn
+
+    if fd_type == _TYPE_MESSAGE:
+        if fd.message_type is _TIMESTAMP_DESC:
+            return _TS_DECODE
+        if recurse is None:
+            recurse = _to_dict
+        # Nested submessage -> recurse with the already-normalized custom map
+        return lambda m: recurse(m, custom_map, use_enum_labels, False, lowercase_enum_labels)
+
+    if fd_type == _TYPE_ENUM and use_enum_labels:
+        labels = _enum_labels(fd.enum_type, lowercase_enum_labels)
+        # Bound dict method: no Python-level wrapper per enum value.
+        return labels.__getitem__
+
+    decode_fn = _DECODER_BY_TYPE[fd_type] if fd_type < _NUM_TYPES else None
+    if decode_fn in _PASSTHROUGH_DECODERS:
+        return None
+    return decode_fn
+
+
+def _custom_map_key(custom_map: Dict[int, Callable[[Any], Any]]) -> tuple:
+    """
+    Hashable identity for a custom decode map, based on its contents.
+    Keying caches by id(custom_map) would silently alias a recycled dict
+    id to a stale entry; content keys cannot go stale.
+    """
+    return tuple(sorted(custom_map.items())) if custom_map else ()
+
+
+# Custom-map content keys seen in an earlier call. A brand-new key
+# (typically a map rebuilt inline with fresh lambdas every call) would add
+# a permanent entry to each cache below and recompile on every call, so
+# first sightings convert through the uncached paths; only maps whose
+# contents recur get compiled. Cleared when full, so adversarial workloads
+# cannot grow it without bound.
+_SEEN_CUSTOM_KEYS: Set[tuple] = set()
+_SEEN_CUSTOM_KEYS_LIMIT = 1024
+
+
+def _custom_map_stable(custom_map: Dict[int, Callable[[Any], Any]]) -> bool:
+    """
+    True once this custom map's contents have shown up in an earlier call,
+    meaning compiling and caching for it will pay for itself.
+    """
+    key = _custom_map_key(custom_map)
+    if key in _SEEN_CUSTOM_KEYS:
+        return True
+    if len(_SEEN_CUSTOM_KEYS) >= _SEEN_CUSTOM_KEYS_LIMIT:
+        _SEEN_CUSTOM_KEYS.clear()
+    _SEEN_CUSTOM_KEYS.add(key)
+    return False
+
+
+# Decoder dicts shared across calls, keyed by (DESCRIPTOR, custom-map
+# contents, use_enum_labels, lowercase_enum_labels). Decoders only depend on
+# the field descriptor and those options, so converting the same message type
+# repeatedly reuses the same callables instead of rebuilding them per call.
+_DECODER_TABLE: Dict[tuple, Dict[FieldDescriptor, Optional[Callable[[Any], Any]]]] = {}
+
+
+def _decoders_for(
+    descriptor: Any,
+    custom_map: Dict[int, Callable[[Any], Any]],
+    use_enum_labels: bool,
+    lowercase_enum_labels: bool,
+) -> Dict[FieldDescriptor, Optional[Callable[[Any], Any]]]:
+    """
+    Returns the shared decoder cache for a message descriptor + options combo,
+    precomputing decoders for all regular fields on first sight. Extension
+    fields are added lazily by the caller.
+    """
+    key = (descriptor, _custom_map_key(custom_map), use_enum_labels, lowercase_enum_labels)
+    decoders = _DECODER_TABLE.get(key)
+    if decoders is None:
+        decoders = {}
+        for fd in descriptor.fields:
+            if _is_map_field(fd):
+                map_val_desc = fd.message_type.fields_by_name["value"]
+                decoders[map_val_desc] = _decode_call(map_val_desc, custom_map, use_enum_labels, lowercase_enum_labels)
+            decoders[fd] = _decode_call(fd, custom_map, use_enum_labels, lowercase_enum_labels)
+        _DECODER_TABLE[key] = decoders
+    return decoders
+
+
+# Default-fill plans for include_defaults, keyed like _DECODER_TABLE. Each
+# entry is a list of (field name, zero-arg filler) pairs with the oneof /
+# singular-submessage exclusions already applied.
+_DEFAULT_FILL_CACHE: Dict[tuple, list] = {}
+
+
+def _build_default_fills(
+    descriptor: Any,
+    custom_map: Dict[int, Callable[[Any], Any]],
+    use_enum_labels: bool,
+    lowercase_enum_labels: bool,
+) -> list:
+    """
+    Builds the include_defaults plan for a message descriptor: which fields
+    get filled when absent, and with what.
+    """
+    fills = []
+    for fd in descriptor.fields:
+        if fd.containing_oneof or (fd.label != _LABEL_REPEATED and fd.cpp_type == _CPPTYPE_MESSAGE):
+            continue
+        if _is_map_field(fd):
+            fills.append((fd.name, dict))
+        elif fd.label == _LABEL_REPEATED:
+            fills.append((fd.name, list))
+        elif fd.type == _TYPE_ENUM and use_enum_labels:
+            decode_fn = _decode_call(fd, custom_map, use_enum_labels, lowercase_enum_labels)
+            label = decode_fn(fd.default_value)
+            fills.append((fd.name, lambda label=label: label))
+        else:
+            fills.append((fd.name, lambda value=fd.default_value: value))
+    return fills
+
+
+def _default_fills(
+    descriptor: Any,
+    custom_map: Dict[int, Callable[[Any], Any]],
+    use_enum_labels: bool,
+    lowercase_enum_labels: bool,
+) -> list:
+    """
+    Returns the cached include_defaults plan for a message descriptor.
+    Evaluating the predicate (oneof membership, singular submessage,
+    map/repeated kind) once per message type leaves only a name check
+    per call.
+    """
+    key = (descriptor, _custom_map_key(custom_map), use_enum_labels, lowercase_enum_labels)
+    fills = _DEFAULT_FILL_CACHE.get(key)
+    if fills is None:
+        fills = _DEFAULT_FILL_CACHE[key] = _build_default_fills(
+            descriptor, custom_map, use_enum_labels, lowercase_enum_labels
         )
+    return fills
 
-    if use_enum_labels and fd.type == FieldDescriptor.TYPE_ENUM:
-        return lambda val: (
-            fd.enum_type.values_by_number[int(val)].name.lower()
-            if lowercase_enum_labels
-            else fd.enum_type.values_by_number[int(val)].name
+
+# Compiled to_dict functions, keyed by (DESCRIPTOR, custom-map contents,
+# use_enum_labels, include_defaults, lowercase_enum_labels).
+_TRANSCODER_TABLE: Dict[tuple, Callable[[Message], Dict[str, Any]]] = {}
+
+
+def _compile_to_dict(
+    descriptor: Any,
+    custom_map: Dict[int, Callable[[Any], Any]],
+    use_enum_labels: bool,
+    include_defaults: bool,
+    lowercase_enum_labels: bool,
+) -> Callable[[Message], Dict[str, Any]]:
+    """
+    Builds a to_dict function specialized for one message type + options.
+
+    The dispatch tree to_dict walks generically is identical on every call
+    for a given descriptor, so the branching is resolved once into
+    generated straight-line source, one block per field, reading message
+    attributes directly. That skips both the per-field dispatch and the
+    (descriptor, value) tuple list ListFields() allocates per call.
+    Presence checks mirror ListFields semantics: HasField for fields with
+    explicit presence, truthiness for implicit-presence scalars and
+    repeated/map containers. include_defaults turns the affected blocks
+    into unconditional reads, since reading an unset field yields its
+    default.
+    """
+    decoders = _decoders_for(descriptor, custom_map, use_enum_labels, lowercase_enum_labels)
+
+    lines = ["def transcode(pb):", "    result = {}"]
+    namespace: Dict[str, Any] = {}
+
+    for i, fd in enumerate(descriptor.fields):
+        name = fd.name
+        read = f"pb.{name}" if not keyword.iskeyword(name) else f"getattr(pb, {name!r})"
+        fillable = include_defaults and not fd.containing_oneof and not (
+            fd.label != _LABEL_REPEATED and fd.cpp_type == _CPPTYPE_MESSAGE
         )
 
-    return DEFAULT_DECODE_MAP.get(fd.type)
+        singular = False
+        if _is_map_field(fd):
+            decode_fn = decoders[fd.message_type.fields_by_name["value"]]
+            if decode_fn is None:
+                expr = "dict(value)"
+            else:
+                namespace[f"_dec{i}"] = decode_fn
+                expr = f"{{k: _dec{i}(v) for k, v in value.items()}}"
+        elif fd.label == _LABEL_REPEATED:
+            decode_fn = decoders[fd]
+            if decode_fn is None:
+                expr = "list(value)"
+            else:
+                namespace[f"_dec{i}"] = decode_fn
+                expr = f"[_dec{i}(x) for x in value]"
+        else:
+            singular = True
+            decode_fn = decoders[fd]
+            if decode_fn is None:
+                expr = "value"
+            else:
+                namespace[f"_dec{i}"] = decode_fn
+                expr = f"_dec{i}(value)"
+
+        # Absent fields filled with a decoded value: only the enum-label
+        # case decodes its default; all other scalars fill the raw default
+        # (matching _default_fills), so a custom decoder must only run on
+        # values that are actually set.
+        decoded_fill = decode_fn is None or not singular or (fd.type == _TYPE_ENUM and use_enum_labels)
+
+        if fillable and decoded_fill:
+            lines.append(f"    value = {read}")
+            lines.append(f"    result[{name!r}] = {expr}")
+        elif fillable:
+            namespace[f"_default{i}"] = fd.default_value
+            if fd.has_presence:
+                lines.append(f"    if pb.HasField({name!r}):")
+                lines.append(f"        value = {read}")
+                lines.append(f"        result[{name!r}] = {expr}")
+            else:
+                lines.append(f"    value = {read}")
+                if fd.type in _FLOAT_TYPES:
+                    namespace["_copysign"] = math.copysign
+                    lines.append("    if value != 0.0 or _copysign(1.0, value) < 0.0:")
+                else:
+                    lines.append("    if value:")
+                lines.append(f"        result[{name!r}] = {expr}")
+            lines.append("    else:")
+            lines.append(f"        result[{name!r}] = _default{i}")
+        elif fd.label != _LABEL_REPEATED and fd.has_presence:
+            lines.append(f"    if pb.HasField({name!r}):")
+            lines.append(f"        value = {read}")
+            lines.append(f"        result[{name!r}] = {expr}")
+        else:
+            lines.append(f"    value = {read}")
+            if fd.type in _FLOAT_TYPES:
+                # Truthiness would drop -0.0, which ListFields reports as set.
+                namespace["_copysign"] = math.copysign
+                lines.append("    if value != 0.0 or _copysign(1.0, value) < 0.0:")
+            else:
+                lines.append("    if value:")
+            lines.append(f"        result[{name!r}] = {expr}")
+
+    lines.append("    return result")
+    source = "\n".join(lines)
+    exec(compile(source, f"<pb2dict transcode {descriptor.full_name}>", "exec"), namespace)
+    return namespace["transcode"]
 
 
 def to_dict(
@@ -137,55 +459,134 @@ def to_dict(
     """
     if fields is None:
         fields = {}
+    elif fields and not _custom_map_stable(fields):
+        # First sighting of these custom-map contents: convert without
+        # compiling, so maps rebuilt per call (fresh lambdas) cannot grow
+        # the module caches or trigger a recompile on every call.
+        return _to_dict_uncached(pb, fields, use_enum_labels, include_defaults, lowercase_enum_labels)
+    return _to_dict(pb, fields, use_enum_labels, include_defaults, lowercase_enum_labels)
 
+
+def _to_dict(
+    pb: Message,
+    fields: Dict[int, Callable[[Any], Any]],
+    use_enum_labels: bool,
+    include_defaults: bool,
+    lowercase_enum_labels: bool,
+) -> Dict[str, Any]:
+    """
+    to_dict after argument normalization; recursive submessage decoding
+    enters here directly, skipping the per-call checks.
+    """
+    descriptor = pb.DESCRIPTOR
+    if not descriptor.is_extendable:
+        key = (descriptor, _custom_map_key(fields), use_enum_labels, include_defaults, lowercase_enum_labels)
+        transcode = _TRANSCODER_TABLE.get(key)
+        if transcode is None:
+            transcode = _TRANSCODER_TABLE[key] = _compile_to_dict(
+                descriptor, fields, use_enum_labels, include_defaults, lowercase_enum_labels
+            )
+        return transcode(pb)
+
+    # Extendable messages may carry extension fields unknown at compile
+    # time; convert those generically.
+    return _to_dict_generic(
+        pb,
+        fields,
+        use_enum_labels,
+        lowercase_enum_labels,
+        _decoders_for(descriptor, fields, use_enum_labels, lowercase_enum_labels),
+        _to_dict,
+        _default_fills(descriptor, fields, use_enum_labels, lowercase_enum_labels) if include_defaults else None,
+    )
+
+
+def _to_dict_uncached(
+    pb: Message,
+    fields: Dict[int, Callable[[Any], Any]],
+    use_enum_labels: bool,
+    include_defaults: bool,
+    lowercase_enum_labels: bool,
+) -> Dict[str, Any]:
+    """
+    _to_dict without the module-level caches, used for custom maps seen for
+    the first time: decoders and fill plans live only for this call, and
+    submessages recurse back into this function, so nothing keyed on the
+    map's contents outlives the conversion.
+    """
+    return _to_dict_generic(
+        pb,
+        fields,
+        use_enum_labels,
+        lowercase_enum_labels,
+        {},
+        _to_dict_uncached,
+        _build_default_fills(pb.DESCRIPTOR, fields, use_enum_labels, lowercase_enum_labels)
+        if include_defaults
+        else None,
+    )
+
+
+def _to_dict_generic(
+    pb: Message,
+    custom_map: Dict[int, Callable[[Any], Any]],
+    use_enum_labels: bool,
+    lowercase_enum_labels: bool,
+    decode_cache: Dict[FieldDescriptor, Optional[Callable[[Any], Any]]],
+    recurse: Callable[..., Dict[str, Any]],
+    default_fills: Optional[list],
+) -> Dict[str, Any]:
+    """
+    Shared generic conversion loop. _to_dict enters with the module-level
+    decoder cache and fill plan; _to_dict_uncached enters with per-call
+    state.
+    """
     result: Dict[str, Any] = {}
     extensions: Dict[str, Any] = {}
-    decode_cache: Dict[FieldDescriptor, Callable[[Any], Any]] = {}
+    label_repeated = _LABEL_REPEATED  # local => LOAD_FAST in the loop
+    result_set = result.__setitem__
+    # One .get against a sentinel instead of a membership test plus a
+    # __getitem__; None is a valid cached decoder (passthrough), so it
+    # cannot double as the miss marker.
+    cache_get = decode_cache.get
 
     for fd, raw_value in pb.ListFields():
         if _is_map_field(fd):
             # For map fields, figure out how to decode the value type.
             map_val_desc = fd.message_type.fields_by_name["value"]
-            if map_val_desc not in decode_cache:
-                decode_cache[map_val_desc] = _decode_call(map_val_desc, fields, use_enum_labels, lowercase_enum_labels)
-            map_decode_fn = decode_cache[map_val_desc]
-            result[fd.name] = {k: map_decode_fn(v) for k, v in raw_value.items()}
+            map_decode_fn = cache_get(map_val_desc, _MISSING)
+            if map_decode_fn is _MISSING:
+                map_decode_fn = decode_cache[map_val_desc] = _decode_call(
+                    map_val_desc, custom_map, use_enum_labels, lowercase_enum_labels, recurse
+                )
+            if map_decode_fn is None:
+                result_set(fd.name, dict(raw_value))
+            else:
+                result_set(fd.name, {k: map_decode_fn(v) for k, v in raw_value.items()})
             continue
 
-        if fd not in decode_cache:
-            decode_cache[fd] = _decode_call(fd, fields, use_enum_labels, lowercase_enum_labels)
-        decode_fn = decode_cache[fd]
+        decode_fn = cache_get(fd, _MISSING)
+        if decode_fn is _MISSING:
+            decode_fn = decode_cache[fd] = _decode_call(
+                fd, custom_map, use_enum_labels, lowercase_enum_labels, recurse
+            )
 
         # Repeated fields => apply the decode function to each element
-        if fd.label == FieldDescriptor.LABEL_REPEATED:
-            decode_fn = lambda vals, fn=decode_fn: [fn(x) for x in vals]
+        if fd.label == label_repeated:
+            value = list(raw_value) if decode_fn is None else [decode_fn(x) for x in raw_value]
+        else:
+            value = raw_value if decode_fn is None else decode_fn(raw_value)
 
         # Extensions get stored separately
         if fd.is_extension:
-            extensions[str(fd.number)] = decode_fn(raw_value)
+            extensions[str(fd.number)] = value
         else:
-            result[fd.name] = decode_fn(raw_value)
-
-    if include_defaults:
-        for fdesc in pb.DESCRIPTOR.fields:
-            # If field is missing, not in a oneof, and not a singular submessage
-            if (
-                fdesc.name not in result
-                and not fdesc.containing_oneof
-                and not (
-                    fdesc.label != FieldDescriptor.LABEL_REPEATED and fdesc.cpp_type == FieldDescriptor.CPPTYPE_MESSAGE
-                )
-            ):
-                if _is_map_field(fdesc):
-                    result[fdesc.name] = {}
-                elif fdesc.label == FieldDescriptor.LABEL_REPEATED:
-                    result[fdesc.name] = []
-                elif fdesc.type == FieldDescriptor.TYPE_ENUM and use_enum_labels:
-                    if fdesc not in decode_cache:
-                        decode_cache[fdesc] = _decode_call(fdesc, fields, use_enum_labels, lowercase_enum_labels)
-                    result[fdesc.name] = decode_cache[fdesc](fdesc.default_value)
-                else:
-                    result[fdesc.name] = fdesc.default_value
+            result_set(fd.name, value)
+
+    if default_fills is not None:
+        for name, filler in default_fills:
+            if name not in result:
+                result_set(name, filler())
 
     if extensions:
         result[EXTENSION_CONTAINER] = extensions
@@ -193,6 +594,138 @@ def to_dict(
     return result
 
 
+# Compiled to_message setter tables, keyed by (DESCRIPTOR, custom-map
+# contents, strict, ignore_none). Each table maps a field name to a
+# setter(pb, value) specialized for that field.
+_SETTER_TABLE: Dict[tuple, Dict[str, Callable[[Message, Any], None]]] = {}
+
+
+def _compile_setter(
+    fd: FieldDescriptor,
+    custom_map: Dict[int, Callable[[Any], Any]],
+    strict: bool,
+    ignore_none: bool,
+) -> Callable[[Message, Any], None]:
+    """
+    Builds a setter(pb, value) for one field, resolving the map/repeated/
+    message/enum branching and custom decoders once instead of per call.
+    """
+    name = fd.name
+
+    if fd.label == _LABEL_REPEATED:
+        if _is_map_field(fd):
+            key_fd = fd.message_type.fields_by_name["key"]
+            val_fd = fd.message_type.fields_by_name["value"]
+            if val_fd.cpp_type == _CPPTYPE_MESSAGE:
+
+                def set_field(pb, value, _skip_none=ignore_none):
+                    container = getattr(pb, name)
+                    for mk, mv in value.items():
+                        if _skip_none and mv is None:
+                            continue
+                        to_message(container[mk], mv, custom_map, strict, ignore_none)
+
+            else:
+                key_decode = custom_map.get(key_fd.type)
+                val_decode = custom_map.get(val_fd.type)
+
+                def set_field(pb, value, _skip_none=ignore_none):
+                    container = getattr(pb, name)
+                    for mk, mv in value.items():
+                        if _skip_none and mv is None:
+                            continue
+                        if key_decode is not None:
+                            mk = key_decode(mk)
+                        if val_decode is not None:
+                            mv = val_decode(mv)
+                        container[mk] = mv
+
+        elif fd.type == _TYPE_MESSAGE:
+
+            def set_field(pb, value, _skip_none=ignore_none):
+                container = getattr(pb, name)
+                for item in value:
+                    if _skip_none and item is None:
+                        continue
+                    to_message(container.add(), item, custom_map, strict, ignore_none)
+
+        else:
+            is_enum = fd.type == _TYPE_ENUM
+            name_map = _enum_by_name(fd.enum_type) if is_enum else None
+            decode = custom_map.get(fd.type)
+
+            def set_field(pb, value, _skip_none=ignore_none):
+                container = getattr(pb, name)
+                for item in value:
+                    if _skip_none and item is None:
+                        continue
+                    if is_enum and isinstance(item, str):
+                        enum_num = name_map.get(item)
+                        if enum_num is None:
+                            # Fallback to uppercase
+                            enum_num = name_map.get(item.upper())
+                        if enum_num is None:
+                            if strict:
+                                raise KeyError(f"Invalid enum label '{item}' for {name}")
+                            # Non-strict fallback
+                            enum_num = 0
+                        container.append(enum_num)
+                    elif isinstance(item, datetime.datetime):
+                        ts = Timestamp()
+                        ts.FromDatetime(item)
+                        container.add().CopyFrom(ts)
+                    else:
+                        if decode is not None:
+                            item = decode(item)
+                        container.append(item)
+
+        return set_field
+
+    is_message = fd.type == _TYPE_MESSAGE
+    is_enum = fd.type == _TYPE_ENUM
+    name_map = _enum_by_name(fd.enum_type) if is_enum else None
+    decode = custom_map.get(fd.type)
+
+    def set_field(pb, value):
+        if isinstance(value, datetime.datetime):
+            ts = Timestamp()
+            ts.FromDatetime(value)
+            getattr(pb, name).CopyFrom(ts)
+            return
+        if is_message:
+            to_message(getattr(pb, name), value, custom_map, strict, ignore_none)
+            return
+        if decode is not None:
+            value = decode(value)
+        # Convert enum labels -> numbers
+        if is_enum and isinstance(value, str):
+            enum_num = name_map.get(value)
+            if enum_num is None:
+                # Fallback to uppercase
+                enum_num = name_map.get(value.upper())
+            if enum_num is None:
+                if strict:
+                    raise KeyError(f"Invalid enum label '{value}' for {name}")
+                # Non-strict fallback
+                enum_num = 0
+            value = enum_num
+        setattr(pb, name, value)
+
+    return set_field
+
+
+def _compile_to_message(
+    descriptor: Any,
+    custom_map: Dict[int, Callable[[Any], Any]],
+    strict: bool,
+    ignore_none: bool,
+) -> Dict[str, Callable[[Message, Any], None]]:
+    """
+    Builds the {field name: setter} table for one message type + options.
+    """
+    return {fd.name: _compile_setter(fd, custom_map, strict, ignore_none) for fd in descriptor.fields}
+
+
 def to_message(
     pb: Union[Type[T], T],
     data: Dict[str, Any],
@@ -206,6 +739,59 @@ def to_message(
     if isinstance(pb, type):
         pb = pb()
 
+    descriptor = pb.DESCRIPTOR
+    if descriptor.is_extendable or EXTENSION_CONTAINER in data:
+        # Extensions are unknown at compile time; convert generically.
+        return _to_message_generic(pb, data, fields, strict, ignore_none)
+
+    if fields and not _custom_map_stable(fields):
+        # First sighting of these custom-map contents: the generic path
+        # keeps one-off maps out of the setter table (see to_dict).
+        return _to_message_generic(pb, data, fields, strict, ignore_none)
+
+    key = (descriptor, _custom_map_key(fields), strict, ignore_none)
+    setters = _SETTER_TABLE.get(key)
+    if setters is None:
+        setters = _SETTER_TABLE[key] = _compile_to_message(descriptor, fields, strict, ignore_none)
+
+    setter_get = setters.get
+    if strict:
+        # Validate every key before mutating, so a bad key leaves pb
+        # untouched — the generic path builds field_info up front and
+        # raises before applying anything.
+        for k in data:
+            if k not in setters:
+                raise KeyError(f"{pb.__class__.__name__} has no field '{k}'")
+
+    # Branch on ignore_none once, not per field.
+    if ignore_none:
+        for k, input_val in data.items():
+            if input_val is None:
+                continue
+            setter = setter_get(k)
+            if setter is not None:
+                setter(pb, input_val)
+    else:
+        for k, input_val in data.items():
+            setter = setter_get(k)
+            if setter is not None:
+                setter(pb, input_val)
+    return pb
+
+
+def _to_message_generic(
+    pb: T,
+    data: Dict[str, Any],
+    fields: Dict[int, Callable[[Any], Any]],
+    strict: bool,
+    ignore_none: bool,
+) -> T:
+    """
+    Cache-free to_message, used for extendable messages, extension
+    payloads, and first-seen custom maps. Submessages recurse back into
+    this function rather than to_message, so a one-off custom map never
+    reaches the compiled setter tables.
+    """
     field_info = []
     for k, v in data.items():
         if k == EXTENSION_CONTAINER:
@@ -217,56 +803,62 @@ def to_message(
         desc = pb.DESCRIPTOR.fields_by_name[k]
         field_info.append((desc, v, getattr(pb, k, None)))
 
-    # Handle extensions
-    for ext_num_str, ext_val in data.get(EXTENSION_CONTAINER, {}).items():
-        try:
-            ext_num = int(ext_num_str)
-        except ValueError:
-            raise ValueError("Extension keys must be integers.")
-        if ext_num not in pb._extensions_by_number:
-            if strict:
-                raise KeyError(f"{pb} has no extension with number {ext_num}")
-            continue
-        ext_field = pb._extensions_by_number[ext_num]
-        field_info.append((ext_field, ext_val, pb.Extensions[ext_field]))
+    # Handle extensions; resolved through the descriptor pool, which works
+    # on both the upb and pure-Python runtimes.
+    ext_data = data.get(EXTENSION_CONTAINER)
+    if ext_data:
+        pool = pb.DESCRIPTOR.file.pool
+        for ext_num_str, ext_val in ext_data.items():
+            try:
+                ext_num = int(ext_num_str)
+            except ValueError:
+                raise ValueError("Extension keys must be integers.")
+            try:
+                ext_field = pool.FindExtensionByNumber(pb.DESCRIPTOR, ext_num)
+            except KeyError:
+                if strict:
+                    raise KeyError(f"{pb} has no extension with number {ext_num}")
+                continue
+            field_info.append((ext_field, ext_val, pb.Extensions[ext_field]))
 
+    label_repeated = _LABEL_REPEATED  # local => LOAD_FAST in the loop
     for fd, input_val, current_val in field_info:
         if ignore_none and input_val is None:
             continue
 
-        if fd.label == FieldDescriptor.LABEL_REPEATED:
+        if fd.label == label_repeated:
             if _is_map_field(fd):
                 key_fd = fd.message_type.fields_by_name["key"]
                 val_fd = fd.message_type.fields_by_name["value"]
                 for mk, mv in input_val.items():
                     if ignore_none and mv is None:
                         continue
-                    if val_fd.cpp_type == FieldDescriptor.CPPTYPE_MESSAGE:
-                        to_message(getattr(pb, fd.name)[mk], mv, fields, strict, ignore_none)
+                    if val_fd.cpp_type == _CPPTYPE_MESSAGE:
+                        _to_message_generic(current_val[mk], mv, fields, strict, ignore_none)
                     else:
                         if key_fd.type in fields:
                             mk = fields[key_fd.type](mk)
                         if val_fd.type in fields:
                             mv = fields[val_fd.type](mv)
-                        getattr(pb, fd.name)[mk] = mv
+                        current_val[mk] = mv
             else:
                 for item in input_val:
                     if ignore_none and item is None:
                         continue
-                    if fd.type == FieldDescriptor.TYPE_MESSAGE:
+                    if fd.type == _TYPE_MESSAGE:
                         sub_msg = current_val.add()
-                        to_message(sub_msg, item, fields, strict, ignore_none)
-                    elif fd.type == FieldDescriptor.TYPE_ENUM and isinstance(item, str):
-                        try:
-                            enum_num = fd.enum_type.values_by_name[item].number
-                        except KeyError:
-                            if item.upper() in fd.enum_type.values_by_name:
-                                enum_num = fd.enum_type.values_by_name[item.upper()].number
-                            else:
-                                if strict:
-                                    raise KeyError(f"Invalid enum label '{item}' for {fd.name}")
-                                # Non-strict fallback
-                                enum_num = 0
+                        _to_message_generic(sub_msg, item, fields, strict, ignore_none)
+                    elif fd.type == _TYPE_ENUM and isinstance(item, str):
+                        name_map = _enum_by_name(fd.enum_type)
+                        enum_num = name_map.get(item)
+                        if enum_num is None:
+                            # Fallback to uppercase
+                            enum_num = name_map.get(item.upper())
+                        if enum_num is None:
+                            if strict:
+                                raise KeyError(f"Invalid enum label '{item}' for {fd.name}")
+                            # Non-strict fallback
+                            enum_num = 0
                         current_val.append(enum_num)
                     elif isinstance(item, datetime.datetime):
                         ts = Timestamp()
@@ -285,8 +877,8 @@ def to_message(
             getattr(pb, fd.name).CopyFrom(ts)
             continue
 
-        if fd.type == FieldDescriptor.TYPE_MESSAGE:
-            to_message(current_val, input_val, fields, strict, ignore_none)
+        if fd.type == _TYPE_MESSAGE:
+            _to_message_generic(current_val, input_val, fields, strict, ignore_none)
             continue
 
         if fd.type in fields:
@@ -297,19 +889,18 @@ def to_message(
             continue
 
         # Convert enum labels -> numbers
-        if fd.type == FieldDescriptor.TYPE_ENUM and isinstance(input_val, str):
-            try:
-                input_val = fd.enum_type.values_by_name[input_val].number
-            except KeyError:
+        if fd.type == _TYPE_ENUM and isinstance(input_val, str):
+            name_map = _enum_by_name(fd.enum_type)
+            enum_num = name_map.get(input_val)
+            if enum_num is None:
                 # Fallback to uppercase
-                up = input_val.upper()
-                if up in fd.enum_type.values_by_name:
-                    input_val = fd.enum_type.values_by_name[up].number
-                else:
-                    if strict:
-                        raise KeyError(f"Invalid enum label '{input_val}' for {fd.name}")
-                    # Non-strict fallback
-                    input_val = 0
+                enum_num = name_map.get(input_val.upper())
+            if enum_num is None:
+                if strict:
+                    raise KeyError(f"Invalid enum label '{input_val}' for {fd.name}")
+                # Non-strict fallback
+                enum_num = 0
+            input_val = enum_num
 
         setattr(pb, fd.name, input_val)
 
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: extension.proto
+# Protobuf Python Version: 5.29.0
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    0,
+    '',
+    'extension.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0f\x65xtension.proto\x12\tmypackage\x1a\x1fgoogle/protobuf/timestamp.proto\"H\n\tExtNested\x12\x0f\n\x07str_val\x18\x01 \x01(\t\x12*\n\x06ts_val\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xbf\x03\n\nExtMessage\x12\x11\n\tint32_val\x18\x01 \x01(\x05\x12\x12\n\nstring_val\x18\x02 \x01(\t\x12\x12\n\ndouble_val\x18\x03 \x01(\x01\x12$\n\x08\x65num_val\x18\x04 \x01(\x0e\x32\x12.mypackage.ExtEnum\x12(\n\nnested_val\x18\x05 \x01(\x0b\x32\x14.mypackage.ExtNested\x12\x31\n\rtimestamp_val\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x1a\n\x12repeated_int32_val\x18\x07 \x03(\x05\x12.\n\x10repeated_msg_val\x18\x08 \x03(\x0b\x32\x14.mypackage.ExtNested\x12>\n\x0estr_to_int_map\x18\t \x03(\x0b\x32&.mypackage.ExtMessage.StrToIntMapEntry\x12,\n\x0e\x61lias_enum_val\x18\n \x01(\x0e\x32\x14.mypackage.AliasEnum\x1a\x32\n\x10StrToIntMapEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01*\x05\x08\x64\x10\xc8\x01\"\xbc\x03\n\x0cPlainMessage\x12\x11\n\tint32_val\x18\x01 \x01(\x05\x12\x12\n\nstring_val\x18\x02 \x01(\t\x12\x12\n\ndouble_val\x18\x03 \x01(\x01\x12$\n\x08\x65num_val\x18\x04 \x01(\x0e\x32\x12.mypackage.ExtEnum\x12(\n\nnested_val\x18\x05 \x01(\x0b\x32\x14.mypackage.ExtNested\x12\x31\n\rtimestamp_val\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x1a\n\x12repeated_int32_val\x18\x07 \x03(\x05\x12.\n\x10repeated_msg_val\x18\x08 \x03(\x0b\x32\x14.mypackage.ExtNested\x12@\n\x0estr_to_int_map\x18\t \x03(\x0b\x32(.mypackage.PlainMessage.StrToIntMapEntry\x12,\n\x0e\x61lias_enum_val\x18\n \x01(\x0e\x32\x14.mypackage.AliasEnum\x1a\x32\n\x10StrToIntMapEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01*5\n\x07\x45xtEnum\x12\x18\n\x14\x45XT_ENUM_UNSPECIFIED\x10\x00\x12\x07\n\x03ONE\x10\x01\x12\x07\n\x03TWO\x10\x02*I\n\tAliasEnum\x12\x1a\n\x16\x41LIAS_ENUM_UNSPECIFIED\x10\x00\x12\n\n\x06SECOND\x10\x02\x12\x10\n\x0cSECOND_ALIAS\x10\x02\x1a\x02\x10\x01:,\n\rext_int32_val\x12\x15.mypackage.ExtMessage\x18\x64 \x01(\x05:-\n\x0e\x65xt_string_val\x12\x15.mypackage.ExtMessage\x18\x65 \x01(\t')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'extension_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_ALIASENUM']._loaded_options = None
+  _globals['_ALIASENUM']._serialized_options = b'\020\001'
+  _globals['_EXTMESSAGE_STRTOINTMAPENTRY']._loaded_options = None
+  _globals['_EXTMESSAGE_STRTOINTMAPENTRY']._serialized_options = b'8\001'
+  _globals['_PLAINMESSAGE_STRTOINTMAPENTRY']._loaded_options = None
+  _globals['_PLAINMESSAGE_STRTOINTMAPENTRY']._serialized_options = b'8\001'
+  _globals['_EXTENUM']._serialized_start=1034
+  _globals['_EXTENUM']._serialized_end=1087
+  _globals['_ALIASENUM']._serialized_start=1089
+  _globals['_ALIASENUM']._serialized_end=1162
+  _globals['_EXTNESTED']._serialized_start=63
+  _globals['_EXTNESTED']._serialized_end=135
+  _globals['_EXTMESSAGE']._serialized_start=138
+  _globals['_EXTMESSAGE']._serialized_end=585
+  _globals['_EXTMESSAGE_STRTOINTMAPENTRY']._serialized_start=528
+  _globals['_EXTMESSAGE_STRTOINTMAPENTRY']._serialized_end=578
+  _globals['_PLAINMESSAGE']._serialized_start=588
+  _globals['_PLAINMESSAGE']._serialized_end=1032
+  _globals['_PLAINMESSAGE_STRTOINTMAPENTRY']._serialized_start=528
+  _globals['_PLAINMESSAGE_STRTOINTMAPENTRY']._serialized_end=578
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,102 @@
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf.internal import python_message as _python_message
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class ExtEnum(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    EXT_ENUM_UNSPECIFIED: _ClassVar[ExtEnum]
+    ONE: _ClassVar[ExtEnum]
+    TWO: _ClassVar[ExtEnum]
+
+class AliasEnum(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    ALIAS_ENUM_UNSPECIFIED: _ClassVar[AliasEnum]
+    SECOND: _ClassVar[AliasEnum]
+    SECOND_ALIAS: _ClassVar[AliasEnum]
+EXT_ENUM_UNSPECIFIED: ExtEnum
+ONE: ExtEnum
+TWO: ExtEnum
+ALIAS_ENUM_UNSPECIFIED: AliasEnum
+SECOND: AliasEnum
+SECOND_ALIAS: AliasEnum
+EXT_INT32_VAL_FIELD_NUMBER: _ClassVar[int]
+ext_int32_val: _descriptor.FieldDescriptor
+EXT_STRING_VAL_FIELD_NUMBER: _ClassVar[int]
+ext_string_val: _descriptor.FieldDescriptor
+
+class ExtNested(_message.Message):
+    __slots__ = ("str_val", "ts_val")
+    STR_VAL_FIELD_NUMBER: _ClassVar[int]
+    TS_VAL_FIELD_NUMBER: _ClassVar[int]
+    str_val: str
+    ts_val: _timestamp_pb2.Timestamp
+    def __init__(self, str_val: _Optional[str] = ..., ts_val: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ...) -> None: ...
+
+class ExtMessage(_message.Message):
+    __slots__ = ("int32_val", "string_val", "double_val", "enum_val", "nested_val", "timestamp_val", "repeated_int32_val", "repeated_msg_val", "str_to_int_map", "alias_enum_val")
+    Extensions: _python_message._ExtensionDict
+    class StrToIntMapEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: int
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[int] = ...) -> None: ...
+    INT32_VAL_FIELD_NUMBER: _ClassVar[int]
+    STRING_VAL_FIELD_NUMBER: _ClassVar[int]
+    DOUBLE_VAL_FIELD_NUMBER: _ClassVar[int]
+    ENUM_VAL_FIELD_NUMBER: _ClassVar[int]
+    NESTED_VAL_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMP_VAL_FIELD_NUMBER: _ClassVar[int]
+    REPEATED_INT32_VAL_FIELD_NUMBER: _ClassVar[int]
+    REPEATED_MSG_VAL_FIELD_NUMBER: _ClassVar[int]
+    STR_TO_INT_MAP_FIELD_NUMBER: _ClassVar[int]
+    ALIAS_ENUM_VAL_FIELD_NUMBER: _ClassVar[int]
+    int32_val: int
+    string_val: str
+    double_val: float
+    enum_val: ExtEnum
+    nested_val: ExtNested
+    timestamp_val: _timestamp_pb2.Timestamp
+    repeated_int32_val: _containers.RepeatedScalarFieldContainer[int]
+    repeated_msg_val: _containers.RepeatedCompositeFieldContainer[ExtNested]
+    str_to_int_map: _containers.ScalarMap[str, int]
+    alias_enum_val: AliasEnum
+    def __init__(self, int32_val: _Optional[int] = ..., string_val: _Optional[str] = ..., double_val: _Optional[float] = ..., enum_val: _Optional[_Union[ExtEnum, str]] = ..., nested_val: _Optional[_Union[ExtNested, _Mapping]] = ..., timestamp_val: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ..., repeated_int32_val: _Optional[_Iterable[int]] = ..., repeated_msg_val: _Optional[_Iterable[_Union[ExtNested, _Mapping]]] = ..., str_to_int_map: _Optional[_Mapping[str, int]] = ..., alias_enum_val: _Optional[_Union[AliasEnum, str]] = ...) -> None: ...
+
+class PlainMessage(_message.Message):
+    __slots__ = ("int32_val", "string_val", "double_val", "enum_val", "nested_val", "timestamp_val", "repeated_int32_val", "repeated_msg_val", "str_to_int_map", "alias_enum_val")
+    class StrToIntMapEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: int
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[int] = ...) -> None: ...
+    INT32_VAL_FIELD_NUMBER: _ClassVar[int]
+    STRING_VAL_FIELD_NUMBER: _ClassVar[int]
+    DOUBLE_VAL_FIELD_NUMBER: _ClassVar[int]
+    ENUM_VAL_FIELD_NUMBER: _ClassVar[int]
+    NESTED_VAL_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMP_VAL_FIELD_NUMBER: _ClassVar[int]
+    REPEATED_INT32_VAL_FIELD_NUMBER: _ClassVar[int]
+    REPEATED_MSG_VAL_FIELD_NUMBER: _ClassVar[int]
+    STR_TO_INT_MAP_FIELD_NUMBER: _ClassVar[int]
+    ALIAS_ENUM_VAL_FIELD_NUMBER: _ClassVar[int]
+    int32_val: int
+    string_val: str
+    double_val: float
+    enum_val: ExtEnum
+    nested_val: ExtNested
+    timestamp_val: _timestamp_pb2.Timestamp
+    repeated_int32_val: _containers.RepeatedScalarFieldContainer[int]
+    repeated_msg_val: _containers.RepeatedCompositeFieldContainer[ExtNested]
+    str_to_int_map: _containers.ScalarMap[str, int]
+    alias_enum_val: AliasEnum
+    def __init__(self, int32_val: _Optional[int] = ..., string_val: _Optional[str] = ..., double_val: _Optional[float] = ..., enum_val: _Optional[_Union[ExtEnum, str]] = ..., nested_val: _Optional[_Union[ExtNested, _Mapping]] = ..., timestamp_val: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ..., repeated_int32_val: _Optional[_Iterable[int]] = ..., repeated_msg_val: _Optional[_Iterable[_Union[ExtNested, _Mapping]]] = ..., str_to_int_map: _Optional[_Mapping[str, int]] = ..., alias_enum_val: _Optional[_Union[AliasEnum, str]] = ...) -> None: ...
@@ -0,0 +1,117 @@
+import datetime
+
+import pytest
+from proto.extension_pb2 import AliasEnum, ExtEnum, ExtMessage, PlainMessage, ext_int32_val, ext_string_val
+
+from pb2dict import EXTENSION_CONTAINER, fields, to_dict, to_message
+
+
+def _populate(msg):
+    now = datetime.datetime(2024, 5, 1, 12, 0, 0)
+    msg.int32_val = 7
+    msg.string_val = "hello"
+    msg.double_val = 1.5
+    msg.enum_val = ExtEnum.TWO
+    msg.nested_val.str_val = "nested"
+    msg.timestamp_val.FromDatetime(now)
+    msg.repeated_int32_val.extend([1, 2, 3])
+    nested = msg.repeated_msg_val.add()
+    nested.str_val = "repeated"
+    nested.ts_val.FromDatetime(now)
+    msg.str_to_int_map["key"] = 9
+    return msg
+
+
+def test_extension_roundtrip():
+    msg = _populate(ExtMessage())
+    msg.Extensions[ext_int32_val] = 42
+    msg.Extensions[ext_string_val] = "ext"
+
+    msg_dict = to_dict(msg)
+    assert msg_dict[EXTENSION_CONTAINER] == {"100": 42, "101": "ext"}
+
+    roundtrip = to_message(ExtMessage, msg_dict)
+    assert roundtrip.int32_val == 7
+    assert roundtrip.Extensions[ext_int32_val] == 42
+    assert roundtrip.Extensions[ext_string_val] == "ext"
+
+
+def test_generic_and_compiled_paths_agree():
+    # ExtMessage is extendable (generic paths), PlainMessage has the same
+    # shape but is not (compiled paths); both must produce identical dicts
+    # across the option matrix.
+    custom_map = {fields.INT32: lambda v: v + 1}
+    option_sets = [
+        {},
+        {"use_enum_labels": True},
+        {"use_enum_labels": True, "lowercase_enum_labels": True},
+        {"include_defaults": True},
+        {"include_defaults": True, "use_enum_labels": True},
+    ]
+    for options in option_sets:
+        for field_map in (None, custom_map):
+            populated_ext = to_dict(_populate(ExtMessage()), field_map, **options)
+            populated_plain = to_dict(_populate(PlainMessage()), field_map, **options)
+            assert populated_ext == populated_plain, options
+
+            empty_ext = to_dict(ExtMessage(), field_map, **options)
+            empty_plain = to_dict(PlainMessage(), field_map, **options)
+            assert empty_ext == empty_plain, options
+
+
+def test_generic_to_message_roundtrip_with_enum_labels():
+    msg = _populate(ExtMessage())
+    msg_dict = to_dict(msg, use_enum_labels=True, lowercase_enum_labels=True)
+    assert msg_dict["enum_val"] == "two"
+
+    roundtrip = to_message(ExtMessage, msg_dict)
+    assert roundtrip.enum_val == ExtEnum.TWO
+    assert roundtrip.str_to_int_map["key"] == 9
+
+
+def test_generic_strict_mode_unknown_field():
+    with pytest.raises(KeyError):
+        to_message(ExtMessage, {"nonexistent_field": 123}, strict=True)
+
+    result = to_message(ExtMessage, {"nonexistent_field": 123}, strict=False)
+    assert isinstance(result, ExtMessage)
+
+
+def test_unknown_extension_number():
+    data = {EXTENSION_CONTAINER: {"999": 1}}
+    with pytest.raises(KeyError):
+        to_message(ExtMessage, data, strict=True)
+
+    result = to_message(ExtMessage, data, strict=False)
+    assert isinstance(result, ExtMessage)
+
+    with pytest.raises(ValueError):
+        to_message(ExtMessage, {EXTENSION_CONTAINER: {"abc": 1}})
+
+
+def test_alias_enum_labels_use_first_declared_name():
+    # allow_alias: both labels map to the same number; decoding must pick
+    # the first-declared one, like enum_type.values_by_number does.
+    for cls in (ExtMessage, PlainMessage):
+        msg = cls()
+        msg.alias_enum_val = AliasEnum.SECOND_ALIAS
+        assert to_dict(msg, use_enum_labels=True)["alias_enum_val"] == "SECOND"
+        roundtrip = to_message(cls, {"alias_enum_val": "SECOND_ALIAS"})
+        assert roundtrip.alias_enum_val == AliasEnum.SECOND
+
+
+def test_map_field_after_repeated_field():
+    # Regression: _is_map_field results were keyed by id(fd), and upb's
+    # weakly-cached descriptor wrappers can recycle ids, so str_to_int_map
+    # could inherit a stale non-map answer and compile a broken setter.
+    to_message(PlainMessage, {"enum_val": "two"})
+    result = to_message(PlainMessage, {"str_to_int_map": {"a": 1}})
+    assert result.str_to_int_map["a"] == 1
+
+
+def test_generic_ignore_none():
+    data = {"int32_val": None, "string_val": "s", EXTENSION_CONTAINER: {"100": 1}}
+    result = to_message(ExtMessage, data, ignore_none=True)
+    assert not result.HasField("int32_val")
+    assert result.string_val == "s"
+    assert result.Extensions[ext_int32_val] == 1
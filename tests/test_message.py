@@ -1,4 +1,5 @@
 import datetime
+import math
 
 import pytest
 from google.protobuf.timestamp_pb2 import Timestamp
@@ -133,3 +134,57 @@ def test_custom_decode_map():
     custom_map = {fields.STRING: decode_str}
     dict_custom = to_dict(msg, custom_map)
     assert dict_custom["string_val"] == "prefix_test"
+
+
+def test_distinct_custom_maps_not_conflated():
+    msg = Message()
+    msg.string_val = "test"
+    dict_one = to_dict(msg, {fields.STRING: lambda s: f"one_{s}"})
+    dict_two = to_dict(msg, {fields.STRING: lambda s: f"two_{s}"})
+    assert dict_one["string_val"] == "one_test"
+    assert dict_two["string_val"] == "two_test"
+
+
+def test_per_call_custom_maps_do_not_grow_caches():
+    from pb2dict import _DECODER_TABLE, _DEFAULT_FILL_CACHE, _SETTER_TABLE, _TRANSCODER_TABLE
+
+    msg = Message()
+    msg.string_val = "test"
+    to_dict(msg, {fields.STRING: lambda s: s})
+    before = (len(_TRANSCODER_TABLE), len(_DECODER_TABLE), len(_SETTER_TABLE), len(_DEFAULT_FILL_CACHE))
+    for i in range(25):
+        result = to_dict(msg, {fields.STRING: lambda s: f"{i}_{s}"}, include_defaults=True)
+        assert result["string_val"] == f"{i}_test"
+        roundtrip = to_message(Message, {"string_val": "x"}, {fields.STRING: lambda s: s})
+        assert roundtrip.string_val == "x"
+    after = (len(_TRANSCODER_TABLE), len(_DECODER_TABLE), len(_SETTER_TABLE), len(_DEFAULT_FILL_CACHE))
+    # Each map above was built inline with fresh lambdas, so every call is
+    # a first sighting and must stay on the uncached paths.
+    assert after == before
+
+
+def test_negative_zero_double_is_set():
+    msg = Message()
+    msg.double_val = -0.0
+    msg_dict = to_dict(msg)
+    assert "double_val" in msg_dict
+    assert math.copysign(1.0, msg_dict["double_val"]) < 0
+
+
+def test_include_defaults_with_custom_map():
+    custom_map = {fields.STRING: lambda s: f"prefix_{s}"}
+    msg = Message()
+    msg.int32_val = 1
+    msg_dict = to_dict(msg, custom_map, include_defaults=True)
+    # Unset fields get the raw default; only set values run the decoder
+    assert msg_dict["string_val"] == ""
+    msg.string_val = "test"
+    msg_dict = to_dict(msg, custom_map, include_defaults=True)
+    assert msg_dict["string_val"] == "prefix_test"
+
+
+def test_strict_mode_leaves_message_untouched():
+    msg = Message()
+    with pytest.raises(KeyError):
+        to_message(msg, {"int32_val": 7, "nonexistent_field": 1})
+    assert msg.int32_val == 0